@@ -0,0 +1,77 @@
+# cython: language_level=3
+"""
+Optional C extension with the numeric DSCR kernel.
+
+This is the hand-tuned native version of _dscr_kernel in ai_rent_dscr.py:
+all locals are C doubles and the hot body touches no Python objects, so the
+whole calculation compiles to a short straight-line routine.
+
+Build in place with:
+
+    python setup_cython.py build_ext --inplace
+
+ai_rent_dscr falls back to the Numba/pure-Python kernel when this module
+has not been built.
+"""
+
+
+cpdef tuple calc_dscr(
+    double purchase_price,
+    double down_payment_amount,
+    double down_payment_percent,
+    double interest_rate_annual,
+    double term_years,
+    bint interest_only,
+    double vacancy_rate,
+    double estimated_monthly_rent,
+    double property_tax_monthly,
+    double insurance_monthly,
+    double hoa_monthly
+):
+    """Loan amount, debt service, NOI, DSCR, and cashflow in one call."""
+    cdef double dp_amount, loan_amount, dp_percent, monthly_debt_service
+    cdef double effective_gross_income_monthly, monthly_operating_expenses
+    cdef double NOI_monthly, NOI_annual, DSCR
+    cdef double monthly_cashflow, r, n, factor
+
+    # Loan amount (explicit amount wins, then percent, then 20% default)
+    if down_payment_amount > 0:
+        dp_amount = down_payment_amount
+    elif down_payment_percent > 0:
+        dp_amount = purchase_price * down_payment_percent
+    else:
+        dp_amount = purchase_price * 0.20
+    loan_amount = purchase_price - dp_amount
+    dp_percent = dp_amount / purchase_price if purchase_price > 0 else 0.0
+
+    # Monthly debt service (P&I)
+    if loan_amount <= 0:
+        monthly_debt_service = 0.0
+    elif interest_only:
+        # 1.0/12.0 is folded to a constant at compile time, keeping this a
+        # multiply and matching the Python kernel bit-for-bit
+        monthly_debt_service = loan_amount * (interest_rate_annual * (1.0 / 12.0))
+    else:
+        r = interest_rate_annual * (1.0 / 12.0)
+        n = term_years * 12.0
+        if r == 0.0:
+            monthly_debt_service = loan_amount / n
+        else:
+            factor = (1.0 + r) ** n
+            monthly_debt_service = loan_amount * (r * factor) / (factor - 1.0)
+
+    # NOI = Income - Operating Expenses (does NOT subtract debt service)
+    effective_gross_income_monthly = estimated_monthly_rent * (1.0 - vacancy_rate)
+    monthly_operating_expenses = property_tax_monthly + insurance_monthly + hoa_monthly
+    NOI_monthly = effective_gross_income_monthly - monthly_operating_expenses
+    NOI_annual = NOI_monthly * 12.0
+
+    # The *12 cancels in NOI_annual / annual_debt_service
+    DSCR = NOI_monthly / monthly_debt_service if monthly_debt_service > 0 else 0.0
+    monthly_cashflow = NOI_monthly - monthly_debt_service
+
+    return (
+        loan_amount, dp_amount, dp_percent, monthly_debt_service,
+        effective_gross_income_monthly, monthly_operating_expenses,
+        NOI_monthly, NOI_annual, DSCR, monthly_cashflow
+    )
@@ -6,6 +6,9 @@ Structure: Each location has tiered $/sqft rates by property size
 Target: 1800 sqft properties used as calibration benchmark
 """
 
+import re
+from bisect import bisect_right
+
 # ==================================================================================
 # SC RENTAL MARKET RATES BY LOCATION
 # ==================================================================================
@@ -203,6 +206,77 @@ SC_RENTAL_RATES = {
 }
 
 
+# Priority-ordered keyword checks (order matters - specific areas before
+# general ones). This is the data the combined matcher below is built from.
+_LOCATION_CHECKS = [
+    # Ultra-luxury coastal
+    ("HILTON HEAD", "Hilton Head"),
+    ("KIAWAH", "Kiawah"),
+    ("ISLE OF PALMS", "Isle of Palms"),
+    ("SEABROOK", "Seabrook"),
+    ("SULLIVANS ISLAND", "Sullivans Island"),
+    ("FRIPP ISLAND", "Fripp Island"),
+
+    # Charleston - specific to general
+    ("DANIEL ISLAND", "Daniel Island"),
+    ("FOLLY BEACH", "Folly Beach"),
+    ("JAMES ISLAND", "James Island"),
+    ("WEST ASHLEY", "West Ashley"),
+    ("MOUNT PLEASANT", "Mount Pleasant"),
+    ("SUMMERVILLE", "Summerville"),
+    ("NORTH CHARLESTON", "North Charleston"),
+    # Check for downtown keywords
+    (["DOWNTOWN", "PENINSULA", "BATTERY", "WATERFRONT"], "Charleston Downtown"),
+    ("CHARLESTON", "Charleston"),  # General Charleston last
+
+    # Myrtle Beach area
+    ("NORTH MYRTLE", "North Myrtle Beach"),
+    ("LITTLE RIVER", "Little River"),
+    ("SURFSIDE", "Surfside"),
+    ("MURRELLS INLET", "Murrells Inlet"),
+    ("PAWLEYS ISLAND", "Pawleys Island"),
+    ("GARDEN CITY", "Garden City"),
+    ("MYRTLE BEACH", "Myrtle Beach"),
+
+    # Other coastal
+    ("BEAUFORT", "Beaufort"),
+    ("EDISTO", "Edisto"),
+    ("GEORGETOWN", "Georgetown"),
+
+    # Columbia
+    ("FOREST ACRES", "Forest Acres"),
+    ("LEXINGTON", "Lexington"),
+    ("IRMO", "Irmo"),
+    ("COLUMBIA", "Columbia"),
+
+    # Upstate
+    ("SIMPSONVILLE", "Simpsonville"),
+    ("GREER", "Greer"),
+    ("CLEMSON", "Clemson"),
+    ("SPARTANBURG", "Spartanburg"),
+    ("ANDERSON", "Anderson"),
+    ("GREENVILLE", "Greenville"),
+]
+
+# Flatten the checks into keyword -> (priority, location) and precompile a
+# single alternation regex, so matching an address is one C-level scan
+# instead of ~35 Python-level substring checks. Longest keywords first so
+# e.g. "NORTH MYRTLE" wins over "MYRTLE BEACH" at the same position.
+_LOCATION_KEYWORD_INFO = {}
+for _priority, (_check, _name) in enumerate(_LOCATION_CHECKS):
+    for _keyword in (_check if isinstance(_check, list) else [_check]):
+        _LOCATION_KEYWORD_INFO.setdefault(_keyword, (_priority, _name))
+
+_LOCATION_RE = re.compile(
+    "|".join(sorted(_LOCATION_KEYWORD_INFO, key=len, reverse=True))
+)
+
+# Size-tier boundaries (sqft) and tier names - looked up with bisect instead
+# of an if/elif chain
+_SIZE_TIER_BOUNDS = (1000, 1500, 2000, 2500)
+_SIZE_TIER_NAMES = ("small", "medium", "standard", "large", "very_large")
+
+
 def get_rental_rate_for_location(address: str, sqft: int) -> dict:
     """
     Get rental rate information for a specific location and property size.
@@ -216,89 +290,23 @@ def get_rental_rate_for_location(address: str, sqft: int) -> dict:
     """
     address_upper = address.upper()
 
-    # Determine size tier
-    if sqft < 1000:
-        size_tier = "small"
-    elif sqft < 1500:
-        size_tier = "medium"
-    elif sqft < 2000:
-        size_tier = "standard"
-    elif sqft < 2500:
-        size_tier = "large"
-    else:
-        size_tier = "very_large"
+    # Determine size tier - one binary search over the threshold table
+    size_tier = _SIZE_TIER_NAMES[bisect_right(_SIZE_TIER_BOUNDS, sqft)]
 
-    # Match location (order matters - check specific areas before general ones)
-    location_data = None
+    # Match location - one combined regex scan, then pick the
+    # highest-priority keyword found (specific areas before general ones)
     matched_location = None
+    best_priority = None
+    for match in _LOCATION_RE.finditer(address_upper):
+        priority, location_name = _LOCATION_KEYWORD_INFO[match.group(0)]
+        if best_priority is None or priority < best_priority:
+            best_priority = priority
+            matched_location = location_name
 
-    # Check for specific matches first
-    location_checks = [
-        # Ultra-luxury coastal
-        ("HILTON HEAD", "Hilton Head"),
-        ("KIAWAH", "Kiawah"),
-        ("ISLE OF PALMS", "Isle of Palms"),
-        ("SEABROOK", "Seabrook"),
-        ("SULLIVANS ISLAND", "Sullivans Island"),
-        ("FRIPP ISLAND", "Fripp Island"),
-
-        # Charleston - specific to general
-        ("DANIEL ISLAND", "Daniel Island"),
-        ("FOLLY BEACH", "Folly Beach"),
-        ("JAMES ISLAND", "James Island"),
-        ("WEST ASHLEY", "West Ashley"),
-        ("MOUNT PLEASANT", "Mount Pleasant"),
-        ("SUMMERVILLE", "Summerville"),
-        ("NORTH CHARLESTON", "North Charleston"),
-        # Check for downtown keywords
-        (["DOWNTOWN", "PENINSULA", "BATTERY", "WATERFRONT"], "Charleston Downtown"),
-        ("CHARLESTON", "Charleston"),  # General Charleston last
-
-        # Myrtle Beach area
-        ("NORTH MYRTLE", "North Myrtle Beach"),
-        ("LITTLE RIVER", "Little River"),
-        ("SURFSIDE", "Surfside"),
-        ("MURRELLS INLET", "Murrells Inlet"),
-        ("PAWLEYS ISLAND", "Pawleys Island"),
-        ("GARDEN CITY", "Garden City"),
-        ("MYRTLE BEACH", "Myrtle Beach"),
-
-        # Other coastal
-        ("BEAUFORT", "Beaufort"),
-        ("EDISTO", "Edisto"),
-        ("GEORGETOWN", "Georgetown"),
-
-        # Columbia
-        ("FOREST ACRES", "Forest Acres"),
-        ("LEXINGTON", "Lexington"),
-        ("IRMO", "Irmo"),
-        ("COLUMBIA", "Columbia"),
-
-        # Upstate
-        ("SIMPSONVILLE", "Simpsonville"),
-        ("GREER", "Greer"),
-        ("CLEMSON", "Clemson"),
-        ("SPARTANBURG", "Spartanburg"),
-        ("ANDERSON", "Anderson"),
-        ("GREENVILLE", "Greenville"),
-    ]
-
-    for check, location_name in location_checks:
-        if isinstance(check, list):
-            # Multiple keywords (for Charleston Downtown)
-            if any(keyword in address_upper for keyword in check):
-                location_data = SC_RENTAL_RATES[location_name]
-                matched_location = location_name
-                break
-        else:
-            # Single keyword
-            if check in address_upper:
-                location_data = SC_RENTAL_RATES[location_name]
-                matched_location = location_name
-                break
-
-    # Fallback to default
-    if not location_data:
+    if matched_location:
+        location_data = SC_RENTAL_RATES[matched_location]
+    else:
+        # Fallback to default
         location_data = SC_RENTAL_RATES["Default SC"]
         matched_location = "Default SC"
 
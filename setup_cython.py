@@ -0,0 +1,17 @@
+"""
+Build script for the optional _ai_rent_core C extension.
+
+Run with:
+    python setup_cython.py build_ext --inplace
+
+The calculator works without it - ai_rent_dscr falls back to the
+Numba/pure-Python kernel when the extension is not built.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="ai-rent-dscr-core",
+    ext_modules=cythonize("_ai_rent_core.pyx", language_level=3),
+)
@@ -222,12 +222,12 @@ if st.session_state.result:
             value=f"{result['DSCR']:.2f}"
         )
         risk = result['risk_label']
-        if risk == "Excellent":
+        if risk == "Strong":
             st.success(f"✓ {risk}")
-        elif risk == "Good":
-            st.success(f"✓ {risk}")
-        else:  # Borderline
+        elif risk == "Borderline":
             st.warning(f"⚠ {risk}")
+        else:  # Weak
+            st.error(f"✗ {risk}")
 
     with col2:
         st.metric(
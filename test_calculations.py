@@ -98,6 +98,49 @@ def test_debt_service_calculation():
     print("\n✅ All debt service calculation tests passed!\n")
 
 
+def test_batch_calculation():
+    """Test vectorized batch calculation against the scalar helpers."""
+    print("\n" + "="*80)
+    print("TEST: Batch Calculation (NumPy)")
+    print("="*80)
+
+    import numpy as np
+
+    calculator = AIRentDSCRCalculator()
+
+    batch = calculator.calculate_batch(
+        purchase_price=np.array([400000.0, 200000.0]),
+        estimated_monthly_rent=np.array([2500.0, 1500.0]),
+        down_payment_percent=np.array([0.25, 0.0]),
+        interest_rate_annual=np.array([0.07, 0.08]),
+        term_years=np.array([30, 30]),
+        property_tax_monthly=np.array([300.0, 150.0])
+    )
+
+    # Test 1: Amortized payment matches the scalar formula
+    scalar_payment = calculator._calculate_debt_service(
+        loan_amount=300000,
+        interest_rate_annual=0.07,
+        term_years=30,
+        interest_only=False
+    )
+    assert abs(batch['monthly_debt_service'][0] - scalar_payment) < 0.01, \
+        f"Expected {scalar_payment}, got {batch['monthly_debt_service'][0]}"
+    print(f"✓ Test 1 passed: Batch payment matches scalar = ${batch['monthly_debt_service'][0]:.2f}")
+
+    # Test 2: Default 20% down applied when no down payment given
+    assert batch['loan_amount'][1] == 160000, \
+        f"Expected 160000, got {batch['loan_amount'][1]}"
+    print("✓ Test 2 passed: Default 20% down payment in batch")
+
+    # Test 3: Risk labels assigned per row
+    assert all(label in ('Strong', 'Borderline', 'Weak') for label in batch['risk_label']), \
+        f"Unexpected labels: {batch['risk_label']}"
+    print("✓ Test 3 passed: Risk labels assigned")
+
+    print("\n✅ All batch calculation tests passed!\n")
+
+
 def test_risk_labels():
     """Test DSCR risk label assignment."""
     print("\n" + "="*80)
@@ -243,6 +286,7 @@ def run_all_tests():
     try:
         test_loan_amount_calculation()
         test_debt_service_calculation()
+        test_batch_calculation()
         test_risk_labels()
         test_full_calculation()
         test_edge_cases()